@@ -7,27 +7,102 @@ copies assets, and creates the final static site ready for deployment.
 """
 
 import argparse
+import csv
 import json
+import os
 import shutil
+import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
-import pandas as pd
-from jinja2 import Environment, FileSystemLoader
-from markdown import markdown
-
-
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Compiled template bytecode persists here between builds
+BYTECODE_CACHE_DIR = Path(__file__).parent.parent / '.jinja-cache'
+
+# Below this many pages, worker startup (imports, template compilation)
+# costs more than rendering everything in-process
+MIN_PAGES_PER_POOL = 200
+
+TEMPLATE_NAMES = (
+    'home.html',
+    'browse.html',
+    'methods.html',
+    'about.html',
+    'data.html',
+    'calendar.html',
+)
+
+
+@dataclass(slots=True)
+class CalendarCtx:
+    """Fixed set of calendar fields exposed to calendar.html."""
+
+    id: str
+    catalog: str
+    institute: str = ''
+    location_name: str = ''
+    diocese_name: str = ''
+    material_primary: str = ''
+    material_secondary: str = ''
+    shape: str = ''
+    sides: str = ''
+    solar: str = ''
+    completed: str = ''
+    year: str = ''
+    year_min: float | None = None  # Would need parsing
+    year_max: float | None = None
+    period: str = ''  # Would need computation
+    latitude: float | None = None
+    longitude: float | None = None
+
+
+# Compiled templates for the current process, filled by init_templates()
+_templates: dict[str, Template] = {}
+
+
+@lru_cache(maxsize=4)
 def load_translations(lang: str, i18n_dir: Path) -> dict:
-    """Load translation dictionary for given language."""
+    """
+    Load translation dictionary for given language.
+
+    The result is cached and shared between callers, so it must not be
+    mutated. Render workers receive it through the page context and never
+    read the JSON files themselves.
+    """
     trans_file = i18n_dir / f'{lang}.json'
     if not trans_file.exists():
         raise FileNotFoundError(f"Translation file not found: {trans_file}")
 
-    with open(trans_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(trans_file, 'rb') as f:
+        return _loads(f.read())
+
+
+@lru_cache(maxsize=None)
+def _markdown_converter():
+    """
+    Create the shared Markdown converter on first use.
 
+    markdown's codehilite extension pulls in Pygments, so the import is
+    deferred until content is actually rendered. Extension setup is costly
+    too, so a single converter is reset and reused for every page.
+    """
+    from markdown import Markdown
 
+    return Markdown(extensions=['extra', 'codehilite'])
+
+
+@lru_cache(maxsize=None)
 def load_markdown_content(lang: str, page: str, i18n_dir: Path) -> str:
     """Load and render markdown content for a page."""
     md_file = i18n_dir / lang / f'{page}.md'
@@ -37,31 +112,136 @@ def load_markdown_content(lang: str, page: str, i18n_dir: Path) -> str:
     with open(md_file, 'r', encoding='utf-8') as f:
         md_text = f.read()
 
-    return markdown(md_text, extensions=['extra', 'codehilite'])
+    md = _markdown_converter()
+    md.reset()
+    return md.convert(md_text)
+
+
+def copy_file(src: Path, dest: Path) -> None:
+    """
+    Copy file contents without metadata.
+
+    Uses a kernel-side copy_file_range() where available (reflinked on
+    copy-on-write filesystems) and falls back to shutil.copyfile.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as s, open(dest, 'wb') as d:
+                remaining = os.fstat(s.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+            # Short copy (e.g. the source shrank); copyfile rewrites dest
+        except OSError:
+            pass  # e.g. unsupported filesystem; copyfile rewrites dest
+
+    shutil.copyfile(src, dest)
+
+
+def open_bytecode_cache() -> FileSystemBytecodeCache | None:
+    """
+    Return the on-disk template bytecode cache, or None if it is unusable.
+
+    The cache is optional, so a read-only checkout or CI cache just builds
+    without it instead of failing.
+    """
+    try:
+        BYTECODE_CACHE_DIR.mkdir(exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(BYTECODE_CACHE_DIR, os.W_OK):
+        return None
+    return FileSystemBytecodeCache(str(BYTECODE_CACHE_DIR))
+
+
+def init_templates(template_dir: Path) -> None:
+    """
+    Compile all site templates into the module-level cache.
+
+    Jinja2 environments cannot be pickled, so this runs once in the main
+    process and once in every render worker.
+    """
+    # Templates are fixed for the lifetime of a build: skip mtime checks and
+    # compile each one at most once, reusing bytecode from earlier builds
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=open_bytecode_cache(),
+    )
+    _templates.clear()
+    _templates.update((name, env.get_template(name)) for name in TEMPLATE_NAMES)
+
+
+def render_page(template_name: str, context: dict) -> bytes:
+    """Render a cached template to UTF-8 encoded HTML."""
+    return _templates[template_name].render(**context).encode('utf-8')
+
+
+def write_page(output_path: str, data: bytes) -> str:
+    """
+    Write rendered HTML to output file.
+
+    The output directory must already exist (see render_pages).
+    """
+    with open(output_path, 'wb') as f:
+        f.write(data)
+
+    return output_path
 
 
 def build_page(
-    env: Environment,
     template_name: str,
-    output_path: Path,
+    output_path: str,
     context: dict,
-) -> None:
-    """Render a template and write to output file."""
-    template = env.get_template(template_name)
-    html = template.render(**context)
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
-
-    print(f"  ✓ {output_path.relative_to(output_path.parents[1])}")
+) -> str:
+    """Render a cached template and write to output file."""
+    return write_page(output_path, render_page(template_name, context))
+
+
+def render_pages(pages: list[tuple[str, str, dict]], template_dir: Path, jobs: int) -> list[str]:
+    """
+    Render (template_name, output_path, context) tasks.
+
+    Pages are independent, so with more than one job and at least
+    MIN_PAGES_PER_POOL pages they are spread over a process pool in roughly
+    one chunk per worker to amortize startup. Otherwise pages render
+    in-process and writes go to a background thread, so the next page
+    renders while the previous one is written.
+
+    Returns:
+        Paths of the written pages
+    """
+    # Create the whole output tree once instead of once per page
+    for output_dir in {os.path.dirname(output_path) for _, output_path, _ in pages}:
+        os.makedirs(output_dir, exist_ok=True)
+
+    if jobs <= 1 or len(pages) < MIN_PAGES_PER_POOL:
+        init_templates(template_dir)
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            writes = [
+                writer.submit(write_page, output_path, render_page(template_name, context))
+                for template_name, output_path, context in pages
+            ]
+            return [write.result() for write in writes]
+
+    chunksize = max(1, -(-len(pages) // jobs))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_templates,
+        initargs=(template_dir,),
+    ) as executor:
+        return list(executor.map(build_page, *zip(*pages), chunksize=chunksize))
 
 
 def build_calendar_pages(
-    env: Environment,
-    inventory: pd.DataFrame,
-    calendar_data_index: dict,
-    calendar_data: dict,
+    inventory: list[dict],
+    parsed_calendar_data: dict,
     site_dir: Path,
     lang: str,
     translations: dict,
@@ -69,72 +249,103 @@ def build_calendar_pages(
     build_date: str,
     config: dict,
     base_path: str = '',
-) -> None:
-    """Build individual calendar detail pages."""
-    print(f"Building calendar pages ({lang})...")
+) -> list[tuple[str, str, dict]]:
+    """
+    Collect render tasks for individual calendar detail pages.
+
+    Pages never embed their data; they look it up by id in the shared
+    data/calendars.json manifest written by prepare_data.py.
+    """
+    pages = []
 
     lang_path = '' if lang == 'sv' else '/en'
     base_url = f'{base_path}{lang_path}'
     lang_switch_base = f'{base_path}/en' if lang == 'sv' else base_path
     output_subdir = 'kalendrar' if lang == 'sv' else 'en/calendars'
 
-    for _, row in inventory.iterrows():
-        cal_id = row['id']
+    # Everything that does not depend on the calendar is computed once
+    lang_switch_prefix = f'{lang_switch_base}/{output_subdir}/'
+    # Plain string paths avoid allocating Path objects per row
+    output_prefix = str(site_dir / output_subdir) + '/'
+    base_context = {
+        't': translations,
+        'lang': lang,
+        'base_url': base_url,
+        'version': version,
+        'build_date': build_date,
+        'zenodo_url': config.get('zenodo_url', '#'),
+        'zenodo_doi': config.get('zenodo_doi', ''),
+        'github_url': config.get('github_url', '#'),
+        # The manifest only exists at the site root, not under /en
+        'data_url': f'{base_path}/data',
+        'embed_data': False,
+        'calendar_data': '',
+    }
 
-        # Determine if data should be embedded or loaded externally
-        embed_data = not calendar_data_index.get(cal_id, {}).get('external', False)
+    for row in inventory:
+        cal_id = row['id']
 
-        # Parse calendar data
-        cal_json = calendar_data.get(cal_id, '{}')
-        cal_data = json.loads(cal_json)
-        inv_data = cal_data.get('inventory', {})
+        # Parsed once in build_site() and shared across languages
+        cal_data = parsed_calendar_data.get(cal_id, {})
+        inv_get = (cal_data.get('inventory') or {}).get
+        loc_get = (cal_data.get('location') or {}).get
 
         # Build context
         context = {
-            't': translations,
-            'lang': lang,
-            'base_url': base_url,
-            'lang_switch_url': f'{lang_switch_base}/{output_subdir}/{cal_id}.html',
-            'version': version,
-            'build_date': build_date,
-            'calendar': {
-                'id': cal_id,
-                'catalog': row.get('cal_label', cal_id),
-                'institute': inv_data.get('institute', ''),
-                'location_name': cal_data.get('location', {}).get('location_name', ''),
-                'diocese_name': cal_data.get('location', {}).get('diocese_name', ''),
-                'material_primary': inv_data.get('material_primary', ''),
-                'material_secondary': inv_data.get('material_secondary1', ''),
-                'shape': inv_data.get('shape', ''),
-                'sides': inv_data.get('sides', ''),
-                'solar': inv_data.get('solar', ''),
-                'completed': inv_data.get('completed', ''),
-                'year': inv_data.get('year', ''),
-                'year_min': None,  # Would need parsing
-                'year_max': None,
-                'period': '',  # Would need computation
-                'latitude': cal_data.get('location', {}).get('latitude'),
-                'longitude': cal_data.get('location', {}).get('longitude'),
-            },
-            'embed_data': embed_data,
-            'calendar_data': cal_json if embed_data else '',
-            'zenodo_url': config.get('zenodo_url', '#'),
-            'zenodo_doi': config.get('zenodo_doi', ''),
-            'github_url': config.get('github_url', '#'),
+            **base_context,
+            'lang_switch_url': lang_switch_prefix + cal_id + '.html',
+            'calendar': CalendarCtx(
+                id=cal_id,
+                catalog=row.get('cal_label', cal_id),
+                institute=inv_get('institute', ''),
+                location_name=loc_get('location_name', ''),
+                diocese_name=loc_get('diocese_name', ''),
+                material_primary=inv_get('material_primary', ''),
+                material_secondary=inv_get('material_secondary1', ''),
+                shape=inv_get('shape', ''),
+                sides=inv_get('sides', ''),
+                solar=inv_get('solar', ''),
+                completed=inv_get('completed', ''),
+                year=inv_get('year', ''),
+                latitude=loc_get('latitude'),
+                longitude=loc_get('longitude'),
+            ),
         }
 
-        output_path = site_dir / output_subdir / f'{cal_id}.html'
-        build_page(env, 'calendar.html', output_path, context)
+        output_path = output_prefix + cal_id + '.html'
+        pages.append(('calendar.html', output_path, context))
 
+    return pages
 
-def main():
+
+def clear_caches() -> None:
+    """Forget loaded translations and content so the next build rereads them."""
+    load_translations.cache_clear()
+    load_markdown_content.cache_clear()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Build static site')
     parser.add_argument('--data-dir', type=Path, required=True)
     parser.add_argument('--site-dir', type=Path, required=True)
     parser.add_argument('--base-path', type=str, default='',
                         help='Base path for deployment (e.g., /runestaves_viz for GitHub Pages)')
-    args = parser.parse_args()
-
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of parallel render workers (1, or a small site, renders in-process)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='List every rendered page')
+    return parser.parse_args(argv)
+
+
+def build_site(args: argparse.Namespace) -> None:
+    """
+    Build the site from parsed command-line arguments.
+
+    Importable so that the watcher can rebuild in-process, skipping
+    interpreter startup and imports and keeping the markdown converter warm.
+    Templates are reloaded every build (so edits are picked up) but compile
+    from the on-disk bytecode cache.
+    """
     data_dir = args.data_dir
     site_dir = args.site_dir
     base_path = args.base_path.rstrip('/')  # Remove trailing slash if present
@@ -153,40 +364,40 @@ def main():
         'github_viz_url': 'https://github.com/username/runestaves_viz',
     }
 
-    # Set up Jinja2 environment
+    # Template and content locations
     template_dir = project_root / 'templates'
     i18n_dir = project_root / 'i18n'
 
-    env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
-
     # Load data needed for building
     print("Loading data...")
-    inventory = pd.read_csv(data_dir / 'inventory.tsv', sep='\t', dtype=str, keep_default_na=False)
-
-    # Load calendar data index
-    calendar_index_file = site_dir / 'data' / 'calendar_index.json'
-    if calendar_index_file.exists():
-        with open(calendar_index_file, 'r', encoding='utf-8') as f:
-            calendar_data_index = json.load(f)
-    else:
-        calendar_data_index = {}
+    # Only row-wise access is needed here, so plain dicts are enough
+    with open(data_dir / 'inventory.tsv', 'r', newline='', encoding='utf-8') as f:
+        inventory = list(csv.DictReader(f, delimiter='\t'))
 
-    # Load calendar data (for embedding or reference)
+    # Load calendar data
     calendar_data = {}
     # For now, we'll handle this in a simplified way
     # In practice, this would load from the generated JSON files
 
-    # Build for both languages
-    for lang in ['sv', 'en']:
-        print(f"\n{'=' * 60}")
-        print(f"Building {lang.upper()} site")
-        print('=' * 60)
+    # Parse each calendar once, not once per language
+    parsed_calendar_data = {cal_id: _loads(cal_json) for cal_id, cal_json in calendar_data.items()}
 
+    # Render all markdown content up front with the shared converter
+    md_content = {
+        (lang, page): load_markdown_content(lang, page, i18n_dir)
+        for lang in ('sv', 'en')
+        for page in ('methods', 'about')
+    }
+
+    # Collect pages for both languages, then render them in one batch
+    pages = []
+    for lang in ['sv', 'en']:
         translations = load_translations(lang, i18n_dir)
         # Construct base_url with deployment base path
         lang_path = '' if lang == 'sv' else '/en'
         base_url = f'{base_path}{lang_path}'
         lang_switch_base = f'{base_path}/en' if lang == 'sv' else base_path
+        lang_dir = str(site_dir) if lang == 'sv' else str(site_dir / 'en')
 
         # Common context for all pages
         common_context = {
@@ -197,51 +408,46 @@ def main():
             'build_date': build_date,
         }
 
-        # Build home page (map)
-        print("Building home page...")
+        # Home page (map)
         home_context = {
             **common_context,
             'lang_switch_url': f'{lang_switch_base}/',
         }
-        output_path = site_dir / ('' if lang == 'sv' else 'en') / 'index.html'
-        build_page(env, 'home.html', output_path, home_context)
+        output_path = f'{lang_dir}/index.html'
+        pages.append(('home.html', output_path, home_context))
 
-        # Build browse page
-        print("Building browse page...")
+        # Browse page
         browse_subdir = 'bladdra' if lang == 'sv' else 'browse'
         browse_context = {
             **common_context,
             'lang_switch_url': f'{lang_switch_base}/{("browse" if lang == "en" else "bladdra")}/',
         }
-        output_path = site_dir / ('' if lang == 'sv' else 'en') / browse_subdir / 'index.html'
-        build_page(env, 'browse.html', output_path, browse_context)
+        output_path = f'{lang_dir}/{browse_subdir}/index.html'
+        pages.append(('browse.html', output_path, browse_context))
 
-        # Build methods page
-        print("Building methods page...")
-        methods_content = load_markdown_content(lang, 'methods', i18n_dir)
+        # Methods page
+        methods_content = md_content[(lang, 'methods')]
         methods_subdir = 'metod' if lang == 'sv' else 'methods'
         methods_context = {
             **common_context,
             'lang_switch_url': f'{lang_switch_base}/{("methods" if lang == "en" else "metod")}/',
             'content': methods_content,
         }
-        output_path = site_dir / ('' if lang == 'sv' else 'en') / methods_subdir / 'index.html'
-        build_page(env, 'methods.html', output_path, methods_context)
+        output_path = f'{lang_dir}/{methods_subdir}/index.html'
+        pages.append(('methods.html', output_path, methods_context))
 
-        # Build about page
-        print("Building about page...")
-        about_content = load_markdown_content(lang, 'about', i18n_dir)
+        # About page
+        about_content = md_content[(lang, 'about')]
         about_subdir = 'om' if lang == 'sv' else 'about'
         about_context = {
             **common_context,
             'lang_switch_url': f'{lang_switch_base}/{("about" if lang == "en" else "om")}/',
             'content': about_content,
         }
-        output_path = site_dir / ('' if lang == 'sv' else 'en') / about_subdir / 'index.html'
-        build_page(env, 'about.html', output_path, about_context)
+        output_path = f'{lang_dir}/{about_subdir}/index.html'
+        pages.append(('about.html', output_path, about_context))
 
-        # Build data page
-        print("Building data page...")
+        # Data page
         # Load citation from data repo
         citation_file = data_dir.parent.parent / 'CITATION.cff'
         citation_text = "Citation information will be added here"
@@ -256,15 +462,13 @@ def main():
             'github_url': config['github_url'],
             'citation': citation_text,
         }
-        output_path = site_dir / ('' if lang == 'sv' else 'en') / 'data' / 'index.html'
-        build_page(env, 'data.html', output_path, data_context)
+        output_path = f'{lang_dir}/data/index.html'
+        pages.append(('data.html', output_path, data_context))
 
-        # Build calendar pages
-        # build_calendar_pages(
-        #     env,
+        # Calendar pages
+        # pages += build_calendar_pages(
         #     inventory,
-        #     calendar_data_index,
-        #     calendar_data,
+        #     parsed_calendar_data,
         #     site_dir,
         #     lang,
         #     translations,
@@ -273,6 +477,15 @@ def main():
         #     config,
         # )
 
+    print(f"\n{'=' * 60}")
+    print(f"Rendering {len(pages)} pages ({args.jobs} jobs)")
+    print('=' * 60)
+    written = render_pages(pages, template_dir, args.jobs)
+    if args.verbose:
+        for output_path in written:
+            print(f"  ✓ {os.path.relpath(output_path, site_dir)}")
+    print(f"  ✓ Rendered {len(written)} pages")
+
     # Copy static assets
     print(f"\n{'=' * 60}")
     print("Copying static assets...")
@@ -282,7 +495,15 @@ def main():
     assets_dest = site_dir / 'assets'
 
     if static_src.exists():
-        shutil.copytree(static_src, assets_dest, dirs_exist_ok=True)
+        if shutil.which('rsync'):
+            # Skips unchanged files on rebuilds; the phylogeny images below
+            # are copied again after --delete
+            subprocess.run(
+                ['rsync', '-a', '--delete', f'{static_src}/', f'{assets_dest}/'],
+                check=True,
+            )
+        else:
+            shutil.copytree(static_src, assets_dest, dirs_exist_ok=True, copy_function=shutil.copyfile)
         print(f"  ✓ Copied assets to {assets_dest.relative_to(site_dir)}")
 
     # Copy phylogeny images from release dir
@@ -292,7 +513,7 @@ def main():
             src = release_dir / img
             if src.exists():
                 dest = assets_dest / img
-                shutil.copy2(src, dest)
+                copy_file(src, dest)
                 print(f"  ✓ Copied {img}")
 
     # Create .nojekyll file
@@ -306,5 +527,9 @@ def main():
     print('=' * 60)
 
 
+def main():
+    build_site(parse_args())
+
+
 if __name__ == '__main__':
     main()
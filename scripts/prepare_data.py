@@ -7,43 +7,117 @@ web display:
   - map_markers.geojson: All calendars with coordinates for Leaflet map
   - search_docs.json: Compact search index for Fuse.js
   - stats.json: Global statistics for charts
-  - calendars/*.json: Per-calendar detailed data (if > 30KB)
+  - calendars.json: Per-calendar detailed data, keyed by calendar id
 
 Outputs are written to the site/data/ directory.
 """
 
 import argparse
-import json
+import os
 import sys
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import orjson
 import pandas as pd
-from geojson import Feature, FeatureCollection, Point
+import pyarrow as pa
+from pyarrow import csv as pacsv
 
+import schemas
 from schemas import ValidationConfig
 
 
-def assign_period_bucket(year_min: float, year_max: float) -> tuple[str, str]:
+def _json_default(value: Any) -> None:
+    """Serialize missing values orjson does not know (e.g. pd.NA) as null."""
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dump_json(obj: Any, indent: bool = False) -> bytes:
     """
-    Assign period bucket based on midpoint of year range.
+    Serialize to compact UTF-8 JSON bytes with orjson.
 
-    Returns:
-        (english_label, swedish_label)
+    NaN and other missing values become null, numpy scalars are supported,
+    and non-string keys are allowed.
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=_json_default, option=option)
+
+
+def read_tsv(path: Path, column_types: dict[str, pa.DataType] | None = None) -> pd.DataFrame:
+    """
+    Read a TSV file with pyarrow's multi-threaded CSV reader.
+
+    Every column is read as a string and empty cells stay empty strings,
+    like pandas with dtype=str and keep_default_na=False. Columns listed in
+    column_types get that type instead, and their empty cells become nulls.
+    """
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        header = f.readline().rstrip('\r\n').split('\t')
+
+    column_types = column_types or {}
+    table = pacsv.read_csv(
+        path,
+        parse_options=pacsv.ParseOptions(delimiter='\t'),
+        convert_options=pacsv.ConvertOptions(
+            column_types={col: column_types.get(col, pa.string()) for col in header},
+            null_values=[''],
+            strings_can_be_null=False,
+        ),
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def validate_sample(df: pd.DataFrame, schema, name: str, sample_size: int = 5000) -> None:
+    """
+    Validate a random sample of a table as a quick sanity check.
+
+    Full validation is validate_data.py's job; this only catches gross
+    problems, stopping at the first failure.
     """
-    if pd.isna(year_min) or pd.isna(year_max):
-        return ('Unknown', 'Okänt')
+    if df.empty:
+        return
+    sample = df.sample(n=min(len(df), sample_size), random_state=0)
+    schemas.validate_dataframe(sample, schema, name, lazy=False)
 
-    midpoint = (year_min + year_max) / 2
 
-    for en_label, sv_label, min_year, max_year in ValidationConfig.PERIOD_BUCKETS:
-        if min_year is None:  # Unknown bucket
-            continue
-        if min_year <= midpoint <= max_year:
-            return (en_label, sv_label)
+# Dated period buckets as arrays, with a trailing Unknown label for misses
+_DATED_BUCKETS = [bucket for bucket in ValidationConfig.PERIOD_BUCKETS if bucket[2] is not None]
+_PERIOD_EN = np.array([bucket[0] for bucket in _DATED_BUCKETS] + ['Unknown'], dtype=object)
+_PERIOD_SV = np.array([bucket[1] for bucket in _DATED_BUCKETS] + ['Okänt'], dtype=object)
+_PERIOD_LOWER = np.array([bucket[2] for bucket in _DATED_BUCKETS], dtype=float)
+_PERIOD_UPPER = np.array([bucket[3] for bucket in _DATED_BUCKETS], dtype=float)
 
-    return ('Unknown', 'Okänt')
+
+def assign_period_buckets(year_min: pd.Series, year_max: pd.Series) -> pd.DataFrame:
+    """
+    Assign period buckets based on midpoint of year range.
+
+    Returns:
+        DataFrame with period_en and period_sv label columns, aligned with
+        year_min. Missing ranges and midpoints outside every bucket are Unknown.
+    """
+    midpoint = ((year_min + year_max) / 2).to_numpy(dtype=float)
+
+    # First bucket whose upper bound is >= midpoint; NaN sorts past the end
+    n_buckets = len(_PERIOD_LOWER)
+    idx = np.searchsorted(_PERIOD_UPPER, midpoint, side='left')
+    in_range = idx < n_buckets
+    in_range[in_range] = midpoint[in_range] >= _PERIOD_LOWER[idx[in_range]]
+    idx[~in_range] = n_buckets
+
+    return pd.DataFrame(
+        {'period_en': _PERIOD_EN[idx], 'period_sv': _PERIOD_SV[idx]},
+        index=year_min.index,
+    )
 
 
 def parse_year_range(year_str: str) -> tuple[float, float]:
@@ -93,6 +167,25 @@ def parse_year_range(year_str: str) -> tuple[float, float]:
         return (float('nan'), float('nan'))
 
 
+def parse_year_range_vec(years: pd.Series) -> pd.DataFrame:
+    """
+    Parse a column of year fields into min/max ranges with parse_year_range.
+
+    Each distinct string is parsed once and the results are broadcast back
+    to every row.
+
+    Returns:
+        DataFrame with float columns year_min and year_max, aligned with years
+    """
+    codes, uniques = pd.factorize(years.fillna('').astype(str))
+    parsed = np.array([parse_year_range(value) for value in uniques], dtype=float).reshape(-1, 2)
+
+    return pd.DataFrame(
+        {'year_min': parsed[codes, 0], 'year_max': parsed[codes, 1]},
+        index=years.index,
+    )
+
+
 def denormalize_gazetteer(inventory: pd.DataFrame, gazetteer: pd.DataFrame) -> pd.DataFrame:
     """
     Denormalize the gazetteer to add location_name, diocese_name, and socken columns to inventory.
@@ -104,62 +197,72 @@ def denormalize_gazetteer(inventory: pd.DataFrame, gazetteer: pd.DataFrame) -> p
         inventory DataFrame with additional columns: location_name, diocese_name, socken,
         latitude, longitude, coord_source
     """
-    # Create a lookup dictionary for geoid -> name
-    geoid_to_name = dict(zip(gazetteer['geoid'], gazetteer['name']))
-    geoid_to_lat = dict(zip(gazetteer['geoid'], gazetteer['latitude']))
-    geoid_to_lon = dict(zip(gazetteer['geoid'], gazetteer['longitude']))
-    geoid_to_accuracy = dict(zip(gazetteer['geoid'], gazetteer['accuracy']))
-
-    # Make a copy to avoid modifying the original
-    result = inventory.copy()
-
-    # Add location details
-    result['location_name'] = result['location_id'].map(geoid_to_name)
-    result['latitude'] = result['location_id'].map(geoid_to_lat)
-    result['longitude'] = result['location_id'].map(geoid_to_lon)
-    result['precision'] = result['location_id'].map(geoid_to_accuracy)
-
-    # Add diocese details
-    result['diocese_name'] = result['diocese_id'].map(geoid_to_name)
-
-    # Add socken details
-    result['socken'] = result['socken_id'].map(geoid_to_name)
+    # A single gazetteer hashtable serves every lookup; -1 marks unknown ids.
+    # A unique index is required, and repeated geoids resolve to their last row.
+    gazetteer = gazetteer.drop_duplicates('geoid', keep='last')
+    gaz_index = pd.Index(gazetteer['geoid'])
+    location_codes = gaz_index.get_indexer(inventory['location_id'])
+    diocese_codes = gaz_index.get_indexer(inventory['diocese_id'])
+    socken_codes = gaz_index.get_indexer(inventory['socken_id'])
+
+    def take(column: str, codes: np.ndarray) -> pd.api.extensions.ExtensionArray:
+        return pd.array(gazetteer[column]).take(codes, allow_fill=True)
+
+    lookups = pd.DataFrame(
+        {
+            # Location details
+            'location_name': take('name', location_codes),
+            'latitude': take('latitude', location_codes),
+            'longitude': take('longitude', location_codes),
+            'precision': take('accuracy', location_codes),
+            # Diocese and socken details
+            'diocese_name': take('name', diocese_codes),
+            'socken': take('name', socken_codes),
+        },
+        index=inventory.index,
+    )
 
-    return result
+    # One concat instead of copying inventory and assigning column by column
+    return pd.concat([inventory, lookups], axis=1)
 
 
-def compute_symbol_categories(symbol_instances: pd.DataFrame, symbol_types: pd.DataFrame) -> dict:
+def compute_symbol_categories(symbol_instances: pd.DataFrame, symbol_types: pd.DataFrame) -> pd.DataFrame:
     """
     Compute boolean flags for each symbol category per calendar.
 
     Returns:
-        dict: {cal_id: {category: bool}}
+        Boolean DataFrame indexed by cal_id with one has_<category> column
+        per category; .to_dict('index') gives {cal_id: {has_<category>: bool}}
     """
     # Build category mapping
     if symbol_types.empty or 'category' not in symbol_types.columns:
         print("  ⚠ symbol_types.tsv missing or has no category column")
-        return {}
+        return pd.DataFrame()
 
     type_to_category = dict(zip(symbol_types['symbol_type'], symbol_types['category']))
 
     # Assign categories to instances
-    symbol_instances['category'] = symbol_instances['symbol_type'].map(type_to_category)
-
-    # Group by calendar and category
-    result = {}
-    for cal_id, group in symbol_instances.groupby('cal_id'):
-        categories = group['category'].dropna().unique()
-        result[cal_id] = {
-            f'has_{cat}': cat in categories for cat in ValidationConfig.SYMBOL_CATEGORIES
-        }
+    symbol_instances['category'] = (
+        symbol_instances['symbol_type'].map(type_to_category).astype('category')
+    )
+
+    # Pivot to calendar x category counts, then test for presence. crosstab
+    # skips calendars whose symbols all lack a category, so every calendar
+    # with symbols is reindexed back in with all-False flags.
+    counts = pd.crosstab(symbol_instances['cal_id'], symbol_instances['category'])
+    counts = counts.reindex(
+        index=symbol_instances['cal_id'].dropna().unique(),
+        columns=ValidationConfig.SYMBOL_CATEGORIES,
+        fill_value=0,
+    )
+    flags = counts > 0
+    flags.columns = [f'has_{cat}' for cat in flags.columns]
 
-    return result
+    return flags
 
 
 def generate_map_markers(
-    inventory: pd.DataFrame,
-    gazetteer: pd.DataFrame,
-    individual: pd.DataFrame,
+    merged: pd.DataFrame,
     symbol_categories: dict,
     output_path: Path,
 ) -> int:
@@ -171,70 +274,72 @@ def generate_map_markers(
     """
     print("Generating map_markers.geojson...")
 
-    # Denormalize gazetteer data into inventory
-    merged = denormalize_gazetteer(inventory, gazetteer)
+    str_cols = [
+        'cal_label', 'institute', 'location_id', 'location_name', 'socken',
+        'diocese_id', 'diocese_name', 'material_primary', 'material_secondary1',
+        'shape', 'row_fest', 'solar', 'completed', 'year',
+    ]
+    needed_cols = [
+        'id', 'latitude', 'longitude', 'precision', 'sides',
+        'year_min', 'year_max', 'period_en', 'period_sv', *str_cols,
+    ]
 
-    # Filter to calendars with valid coordinates
-    valid = merged[merged['latitude'].notna() & merged['longitude'].notna()].copy()
+    # Filter to calendars with valid coordinates, copying only the columns used
+    has_coords = merged['latitude'].notna() & merged['longitude'].notna()
+    valid = merged.loc[has_coords].reindex(columns=needed_cols)
 
     if len(valid) == 0:
         print("  ⚠ No calendars with valid coordinates!")
         return 0
 
-    # Parse year ranges
-    valid[['year_min', 'year_max']] = valid['year'].apply(
-        lambda y: pd.Series(parse_year_range(y))
-    )
-
-    # Assign period buckets
-    valid[['period_en', 'period_sv']] = valid.apply(
-        lambda row: pd.Series(assign_period_bucket(row['year_min'], row['year_max'])), axis=1
-    )
-
-    # Count feasts per calendar (for row_fest detection)
-    feast_counts = individual.groupby('cal_id').size().to_dict()
+    # Fill missing values once, column-wise, so rows are plain dicts below
+    valid[str_cols] = valid[str_cols].fillna('')
+    valid['precision'] = valid['precision'].fillna('unknown')
+    # Only plain digit strings count as a number of sides
+    sides = valid['sides'].fillna('').astype(str)
+    valid['sides_int'] = pd.to_numeric(sides.where(sides.str.isdigit()), errors='coerce').astype('Int64')
 
     features = []
-    for _, row in valid.iterrows():
+    for row in valid.to_dict('records'):
         cal_id = row['id']
 
         # Get symbol category flags
         symbol_flags = symbol_categories.get(cal_id, {})
 
-        # Helper to convert NaN to empty string
-        def safe_get(key, default=''):
-            val = row.get(key, default)
-            return default if pd.isna(val) else val
+        # NaN is the only value not equal to itself
+        year_min = row['year_min']
+        year_max = row['year_max']
+        sides = row['sides_int']
 
         properties = {
             # Identification
             'cal_id': cal_id,
-            'catalog': safe_get('cal_label'),
+            'catalog': row['cal_label'],
             # Provenance
-            'institute_id': safe_get('institute'),
-            'location_id': safe_get('location_id'),
-            'location_name': safe_get('location_name'),
-            'socken': safe_get('socken'),
-            'diocese_id': safe_get('diocese_id'),
-            'diocese_name': safe_get('diocese_name'),
+            'institute_id': row['institute'],
+            'location_id': row['location_id'],
+            'location_name': row['location_name'],
+            'socken': row['socken'],
+            'diocese_id': row['diocese_id'],
+            'diocese_name': row['diocese_name'],
             # Location precision
-            'location_precision': safe_get('precision', 'unknown'),
+            'location_precision': row['precision'],
             # Dating
-            'year': safe_get('year'),
-            'year_min': row['year_min'] if not pd.isna(row['year_min']) else None,
-            'year_max': row['year_max'] if not pd.isna(row['year_max']) else None,
+            'year': row['year'],
+            'year_min': year_min if year_min == year_min else None,
+            'year_max': year_max if year_max == year_max else None,
             'period_bucket_en': row['period_en'],
             'period_bucket_sv': row['period_sv'],
             # Physical
-            'material_primary': safe_get('material_primary'),
-            'material_secondary': safe_get('material_secondary1'),
-            'shape': safe_get('shape'),
-            'sides': int(row['sides']) if pd.notna(row.get('sides')) and str(row.get('sides', '')).isdigit() else None,
+            'material_primary': row['material_primary'],
+            'material_secondary': row['material_secondary1'],
+            'shape': row['shape'],
+            'sides': sides if sides is not pd.NA else None,
             # Notation
-            'row_fest': safe_get('row_fest'),
-            'solar': safe_get('solar'),
+            'row_fest': row['row_fest'],
+            'solar': row['solar'],
             # Data quality
-            'completed': safe_get('completed'),
+            'completed': row['completed'],
             # Links
             'detail_url_sv': f'/kalendrar/{cal_id}.html',
             'detail_url_en': f'/en/calendars/{cal_id}.html',
@@ -243,18 +348,20 @@ def generate_map_markers(
         # Add symbol category flags
         properties.update(symbol_flags)
 
-        feature = Feature(
-            geometry=Point((float(row['longitude']), float(row['latitude']))),
-            properties=properties,
-        )
-        features.append(feature)
+        features.append({
+            'type': 'Feature',
+            'geometry': {
+                'type': 'Point',
+                'coordinates': [float(row['longitude']), float(row['latitude'])],
+            },
+            'properties': properties,
+        })
 
-    geojson = FeatureCollection(features)
+    geojson = {'type': 'FeatureCollection', 'features': features}
 
     # Write to file
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(geojson, f, ensure_ascii=False, separators=(',', ':'))
+    output_path.write_bytes(dump_json(geojson))
 
     file_size = output_path.stat().st_size / 1024  # KB
     print(f"  ✓ Generated {len(features)} markers ({file_size:.1f} KB)")
@@ -265,9 +372,30 @@ def generate_map_markers(
     return len(features)
 
 
+def top_values_by_calendar(df: pd.DataFrame, column: str, n: int = 5) -> dict[str, list]:
+    """
+    Most frequent values of a column per calendar, most frequent first.
+
+    Ties are broken by first appearance, matching Counter.most_common.
+    """
+    values = df[['cal_id', column]].dropna()
+    values = values.assign(_pos=np.arange(len(values)))
+    counts = (
+        values.groupby(['cal_id', column], sort=False, observed=True)['_pos']
+        .agg(['size', 'min'])
+        .reset_index()
+        .sort_values(['cal_id', 'size', 'min'], ascending=[True, False, True], kind='stable')
+    )
+    top = counts.groupby('cal_id', sort=False, observed=True).head(n)
+
+    result: dict[str, list] = defaultdict(list)
+    for cal_id, value in zip(top['cal_id'].tolist(), top[column].tolist()):
+        result[cal_id].append(value)
+    return dict(result)
+
+
 def generate_search_index(
-    inventory: pd.DataFrame,
-    gazetteer: pd.DataFrame,
+    merged: pd.DataFrame,
     individual: pd.DataFrame,
     symbol_instances: pd.DataFrame,
     feast_canonical: pd.DataFrame,
@@ -276,34 +404,17 @@ def generate_search_index(
     """Generate compact search index for Fuse.js."""
     print("Generating search_docs.json...")
 
-    # Denormalize gazetteer data
-    merged = denormalize_gazetteer(inventory, gazetteer)
-
-    # Parse years
-    merged[['year_min', 'year_max']] = merged['year'].apply(
-        lambda y: pd.Series(parse_year_range(y))
-    )
-    merged[['period_en', 'period_sv']] = merged.apply(
-        lambda row: pd.Series(assign_period_bucket(row['year_min'], row['year_max'])), axis=1
-    )
-
     # Get top feasts per calendar
     feast_map = {}
     if not feast_canonical.empty and 'canonical_id' in feast_canonical.columns:
         canonical_names = dict(zip(feast_canonical['canonical_id'], feast_canonical['canonical_name']))
-        for cal_id, group in individual.groupby('cal_id'):
-            feast_ids = group['fest_canonical_id'].dropna()
-            top_feasts = [
-                canonical_names.get(fid, fid)
-                for fid, _ in Counter(feast_ids).most_common(5)
-            ]
-            feast_map[cal_id] = top_feasts
+        feast_map = {
+            cal_id: [canonical_names.get(fid, fid) for fid in feast_ids]
+            for cal_id, feast_ids in top_values_by_calendar(individual, 'fest_canonical_id').items()
+        }
 
     # Get top symbols per calendar
-    symbol_map = {}
-    for cal_id, group in symbol_instances.groupby('cal_id'):
-        top_symbols = [sym for sym, _ in Counter(group['symbol_type'].dropna()).most_common(5)]
-        symbol_map[cal_id] = top_symbols
+    symbol_map = top_values_by_calendar(symbol_instances, 'symbol_type')
 
     docs = []
     for _, row in merged.iterrows():
@@ -324,36 +435,21 @@ def generate_search_index(
         }
         docs.append(doc)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(docs, f, ensure_ascii=False, separators=(',', ':'))
+    output_path.write_bytes(dump_json(docs))
 
     print(f"  ✓ Generated {len(docs)} search documents")
 
 
 def generate_stats(
-    inventory: pd.DataFrame,
-    gazetteer: pd.DataFrame,
-    symbol_instances: pd.DataFrame,
-    symbol_types: pd.DataFrame,
-    symbol_categories: dict,
+    merged: pd.DataFrame,
+    category_flags: pd.DataFrame,
     output_path: Path,
 ) -> None:
     """Generate global statistics for charts."""
     print("Generating stats.json...")
 
-    # Denormalize gazetteer data
-    merged = denormalize_gazetteer(inventory, gazetteer)
-
-    # Parse years and assign periods
-    merged[['year_min', 'year_max']] = merged['year'].apply(
-        lambda y: pd.Series(parse_year_range(y))
-    )
-    merged[['period_en', 'period_sv']] = merged.apply(
-        lambda row: pd.Series(assign_period_bucket(row['year_min'], row['year_max'])), axis=1
-    )
-
     stats = {
-        'total_calendars': len(inventory),
+        'total_calendars': len(merged),
         'by_period_en': dict(Counter(merged['period_en'])),
         'by_period_sv': dict(Counter(merged['period_sv'])),
         'by_diocese': dict(Counter(merged['diocese_name'].dropna())),
@@ -361,21 +457,77 @@ def generate_stats(
         'by_shape': dict(Counter(merged['shape'].dropna())),
     }
 
-    # Symbol category counts
-    category_counts = defaultdict(int)
-    for cal_flags in symbol_categories.values():
-        for category, has_it in cal_flags.items():
-            if has_it:
-                category_counts[category] += 1
-
-    stats['by_symbol_category'] = dict(category_counts)
+    # Symbol category counts (calendars having each category)
+    category_counts = category_flags.sum().astype(int)
+    stats['by_symbol_category'] = category_counts[category_counts > 0].to_dict()
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
+    output_path.write_bytes(dump_json(stats, indent=True))
 
     print(f"  ✓ Generated statistics")
 
 
+def build_calendar_payload(task: tuple) -> tuple[str, bytes]:
+    """
+    Serialize one calendar's detail data.
+
+    Takes only plain Python values so tasks pickle cheaply to pool workers.
+    """
+    cal_id, inv_row, individual_rows, symbol_types, writing_texts, category_counts, location_info = task
+
+    symbol_type_counts = dict(Counter(t for t in symbol_types if t is not None))
+
+    # Co-occurring symbols (same day)
+    # NOTE: symbol_instances doesn't have day_of_year, so we can't compute co-occurrences
+    # If needed in the future, we'd need to join with individual table
+    top_pairs = []
+
+    # Complex markings (tertiary modifiers)
+    # NOTE: symbol_instances doesn't have day_of_year column
+    complex_days = []
+
+    # Writing texts
+    writing_texts = list(dict.fromkeys(t for t in writing_texts if t is not None))[:25]
+
+    data = {
+        'inventory': inv_row,
+        'individual': individual_rows,
+        'symbols': {
+            'by_type': symbol_type_counts,
+            'by_category': category_counts,
+            'top_co_occurring_pairs': top_pairs,
+            'complex_days': complex_days,
+            'writing_texts': writing_texts,
+        },
+        'location': location_info,
+    }
+
+    return cal_id, dump_json(data)
+
+
+def build_calendar_payloads(tasks: list[tuple]) -> list[tuple[str, bytes]]:
+    """Serialize a chunk of calendars in one pool round trip."""
+    return [build_calendar_payload(task) for task in tasks]
+
+
+def map_payloads_bounded(
+    executor: Executor, tasks: Iterable[tuple], chunksize: int, max_pending: int
+) -> Iterator[tuple[str, bytes]]:
+    """
+    Build payloads on executor, in task order.
+
+    Unlike executor.map, tasks are pulled from the iterable only as results
+    are consumed, with at most max_pending chunks in flight at a time.
+    """
+    tasks = iter(tasks)
+    pending = deque()
+    while True:
+        while len(pending) < max_pending and (chunk := list(islice(tasks, chunksize))):
+            pending.append(executor.submit(build_calendar_payloads, chunk))
+        if not pending:
+            return
+        yield from pending.popleft().result()
+
+
 def generate_per_calendar_data(
     inventory: pd.DataFrame,
     individual: pd.DataFrame,
@@ -383,99 +535,95 @@ def generate_per_calendar_data(
     gazetteer: pd.DataFrame,
     symbol_categories: dict,
     output_dir: Path,
-    embed_threshold_kb: int = 30,
-) -> dict:
+    jobs: int = 1,
+) -> dict[str, float]:
     """
-    Generate per-calendar JSON data.
+    Generate per-calendar JSON data as one calendars.json manifest.
+
+    The manifest maps each cal_id to its calendar data, so calendar pages
+    fetch one shared (and browser-cached) file instead of carrying their own
+    copy. Calendars are serialized independently, so with more than one job
+    they are spread over a process pool; results come back in inventory
+    order. Tables are partitioned by calendar up front, but tasks are built
+    lazily and only a few chunks are in flight at once, so payloads are
+    appended to the manifest and dropped as they arrive rather than all being
+    held together.
 
     Returns:
-        dict mapping cal_id -> JSON string (for embedding or file writing)
+        dict mapping cal_id -> payload size in KB, in inventory order
     """
-    print(f"Generating per-calendar data (embed threshold: {embed_threshold_kb}KB)...")
-
-    calendar_data = {}
-    large_calendars = []
-
-    for cal_id in inventory['id']:
-        # Get inventory row
-        inv_row = inventory[inventory['id'] == cal_id].iloc[0].to_dict()
-
-        # Get individual rows
-        individual_rows = individual[individual['cal_id'] == cal_id].fillna('').to_dict('records')
-
-        # Get symbols
-        symbols = symbol_instances[symbol_instances['cal_id'] == cal_id]
-
-        symbol_type_counts = dict(Counter(symbols['symbol_type'].dropna()))
-        category_counts = symbol_categories.get(cal_id, {})
-
-        # Co-occurring symbols (same day)
-        # NOTE: symbol_instances doesn't have day_of_year, so we can't compute co-occurrences
-        # If needed in the future, we'd need to join with individual table
-        top_pairs = []
-
-        # Complex markings (tertiary modifiers)
-        # NOTE: symbol_instances doesn't have day_of_year column
-        complex_days = []
-
-        # Writing texts
-        writing_texts = symbols[symbols['writing_text'].notna()]['writing_text'].unique()[:25].tolist()
-
-        # Location info
-        location_info = {}
-        if pd.notna(inv_row.get('location_id')):
-            gaz_row = gazetteer[gazetteer['geoid'] == inv_row['location_id']]
-            if not gaz_row.empty:
-                gaz = gaz_row.iloc[0]
-                # Also get diocese name if available
-                diocese_name = ''
-                if pd.notna(inv_row.get('diocese_id')):
-                    diocese_row = gazetteer[gazetteer['geoid'] == inv_row['diocese_id']]
-                    if not diocese_row.empty:
-                        diocese_name = diocese_row.iloc[0]['name']
-
-                location_info = {
-                    'location_name': gaz.get('name', ''),
-                    'diocese_name': diocese_name,
-                    'latitude': float(gaz['latitude']) if pd.notna(gaz.get('latitude')) else None,
-                    'longitude': float(gaz['longitude']) if pd.notna(gaz.get('longitude')) else None,
-                }
-
-        data = {
-            'inventory': inv_row,
-            'individual': individual_rows,
-            'symbols': {
-                'by_type': symbol_type_counts,
-                'by_category': category_counts,
-                'top_co_occurring_pairs': top_pairs,
-                'complex_days': complex_days,
-                'writing_texts': writing_texts,
-            },
-            'location': location_info,
-        }
+    print("Generating per-calendar data...")
 
-        json_str = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
-        json_size_kb = len(json_str.encode('utf-8')) / 1024
+    calendar_sizes = {}
 
-        calendar_data[cal_id] = json_str
+    # Partition every table by calendar once instead of filtering per calendar
+    inv_records = inventory.drop_duplicates('id').set_index('id', drop=False).to_dict('index')
+    # individual is read with empty strings for blanks, so no fillna is needed
+    ind_groups = {
+        cal_id: group.to_dict('records')
+        for cal_id, group in individual.groupby('cal_id', sort=False, observed=True)
+    }
+    sym_groups = {
+        cal_id: (group['symbol_type'].tolist(), group['writing_text'].tolist())
+        for cal_id, group in symbol_instances.groupby('cal_id', sort=False, observed=True)
+    }
+    # Repeated geoids resolve to their first row, so .loc always yields a Series
+    gaz_by_geoid = gazetteer.drop_duplicates('geoid', keep='first').set_index('geoid')
+
+    def location_info(inv_row: dict) -> dict:
+        location_id = inv_row.get('location_id')
+        if not (pd.notna(location_id) and location_id in gaz_by_geoid.index):
+            return {}
+
+        gaz = gaz_by_geoid.loc[location_id]
+        # Also get diocese name if available
+        diocese_name = ''
+        diocese_id = inv_row.get('diocese_id')
+        if pd.notna(diocese_id) and diocese_id in gaz_by_geoid.index:
+            diocese_name = gaz_by_geoid.at[diocese_id, 'name']
+
+        return {
+            'location_name': gaz.get('name', ''),
+            'diocese_name': diocese_name,
+            'latitude': float(gaz['latitude']) if pd.notna(gaz.get('latitude')) else None,
+            'longitude': float(gaz['longitude']) if pd.notna(gaz.get('longitude')) else None,
+        }
 
-        if json_size_kb > embed_threshold_kb:
-            large_calendars.append((cal_id, json_size_kb))
+    tasks = (
+        (
+            cal_id,
+            inv_records[cal_id],
+            ind_groups.get(cal_id, []),
+            *sym_groups.get(cal_id, ([], [])),
+            symbol_categories.get(cal_id, {}),
+            location_info(inv_records[cal_id]),
+        )
+        for cal_id in inventory['id']
+    )
 
-    # Write large calendars to separate files
-    if large_calendars:
-        cal_dir = output_dir / 'calendars'
-        cal_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / 'calendars.json'
 
-        for cal_id, size_kb in large_calendars:
-            cal_file = cal_dir / f'{cal_id}.json'
-            with open(cal_file, 'w', encoding='utf-8') as f:
-                f.write(calendar_data[cal_id])
+    def collect(results) -> None:
+        # Payloads are already JSON, so the manifest object is assembled
+        # from them directly instead of being parsed and re-serialized
+        with open(manifest_path, 'wb') as manifest:
+            separator = b'{'
+            for cal_id, payload in results:
+                calendar_sizes[cal_id] = len(payload) / 1024
+                manifest.write(separator + dump_json(cal_id) + b':')
+                manifest.write(payload)
+                separator = b','
+            manifest.write(b'}' if calendar_sizes else b'{}')
 
-        print(f"  ✓ Wrote {len(large_calendars)} large calendars to separate files")
+    if jobs <= 1 or len(inventory) <= 1:
+        collect(map(build_calendar_payload, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            collect(map_payloads_bounded(executor, tasks, chunksize=32, max_pending=2 * jobs))
 
-    print(f"  ✓ Generated data for {len(calendar_data)} calendars")
-    return calendar_data
+    print(f"  ✓ Wrote {manifest_path.name} ({manifest_path.stat().st_size / 1024:.1f} KB)")
+    print(f"  ✓ Generated data for {len(calendar_sizes)} calendars")
+    return calendar_sizes
 
 
 def main():
@@ -483,6 +631,10 @@ def main():
     parser.add_argument('--data-dir', type=Path, required=True)
     parser.add_argument('--release-dir', type=Path, required=True)
     parser.add_argument('--output-dir', type=Path, required=True)
+    parser.add_argument('--validate', action='store_true',
+                        help='Validate a sample of each table against its schema before preparing')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for per-calendar serialization (1 serializes in-process)')
     args = parser.parse_args()
 
     data_dir = args.data_dir
@@ -494,76 +646,91 @@ def main():
         sys.exit(1)
 
     print("Loading TSV files...")
-    inventory = pd.read_csv(data_dir / 'inventory.tsv', sep='\t', dtype=str, keep_default_na=False)
-    individual = pd.read_csv(data_dir / 'individual.tsv', sep='\t', dtype=str, keep_default_na=False)
-    gazetteer = pd.read_csv(data_dir / 'gazetteer.tsv', sep='\t', keep_default_na=False)
-    symbol_instances = pd.read_csv(
-        data_dir / 'generated' / 'symbol_instances.tsv', sep='\t', dtype=str, keep_default_na=False
+    inventory = read_tsv(data_dir / 'inventory.tsv')
+    individual = read_tsv(data_dir / 'individual.tsv')
+    # Only the coordinates are numeric; ids and labels stay strings
+    gazetteer = read_tsv(
+        data_dir / 'gazetteer.tsv',
+        column_types={'latitude': pa.float64(), 'longitude': pa.float64()},
     )
+    symbol_instances = read_tsv(data_dir / 'generated' / 'symbol_instances.tsv')
 
     # Load lookups
-    symbol_types = pd.read_csv(
-        data_dir / 'lookups' / 'symbol_types.tsv', sep='\t', dtype=str, keep_default_na=False
-    )
-    feast_canonical = pd.read_csv(
-        data_dir / 'lookups' / 'feast_canonical.tsv', sep='\t', dtype=str, keep_default_na=False
-    )
+    symbol_types = read_tsv(data_dir / 'lookups' / 'symbol_types.tsv')
+    feast_canonical = read_tsv(data_dir / 'lookups' / 'feast_canonical.tsv')
 
     print(f"  Loaded {len(inventory)} calendars")
     print(f"  Loaded {len(individual)} daily entries")
     print(f"  Loaded {len(gazetteer)} locations")
     print(f"  Loaded {len(symbol_instances)} symbol instances")
 
+    if args.validate:
+        print("\nValidating table samples...")
+        for df, schema, name in (
+            (inventory, schemas.inventory_schema, 'inventory'),
+            (individual, schemas.individual_schema, 'individual'),
+            (gazetteer, schemas.gazetteer_schema, 'gazetteer'),
+            (symbol_instances, schemas.symbol_instances_schema, 'symbol_instances'),
+            (symbol_types, schemas.symbol_types_schema, 'symbol_types'),
+            (feast_canonical, schemas.feast_canonical_schema, 'feast_canonical'),
+        ):
+            validate_sample(df, schema, name)
+
+    # Heavily repeated keys are grouped on repeatedly; hash small codes instead
+    for df, columns in (
+        (symbol_instances, ['cal_id', 'symbol_type']),
+        (individual, ['cal_id', 'fest_canonical_id']),
+    ):
+        for col in columns:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+
     # Compute symbol categories
     print("\nComputing symbol categories...")
-    symbol_categories = compute_symbol_categories(symbol_instances, symbol_types)
+    category_flags = compute_symbol_categories(symbol_instances, symbol_types)
+    symbol_categories = category_flags.to_dict('index')
     print(f"  ✓ Computed categories for {len(symbol_categories)} calendars")
 
+    # Denormalize and date the inventory once for all outputs
+    print("\nDenormalizing inventory...")
+    merged = denormalize_gazetteer(inventory, gazetteer)
+    merged[['year_min', 'year_max']] = parse_year_range_vec(merged['year'])
+    merged[['period_en', 'period_sv']] = assign_period_buckets(merged['year_min'], merged['year_max'])
+
     # Generate outputs
     output_dir.mkdir(parents=True, exist_ok=True)
 
     print("\n" + "=" * 60)
     generate_map_markers(
-        inventory,
-        gazetteer,
-        individual,
+        merged,
         symbol_categories,
         output_dir / 'map_markers.geojson',
     )
 
     generate_search_index(
-        inventory,
-        gazetteer,
+        merged,
         individual,
         symbol_instances,
         feast_canonical,
         output_dir / 'search_docs.json',
     )
 
-    generate_stats(
-        inventory, gazetteer, symbol_instances, symbol_types, symbol_categories, output_dir / 'stats.json'
-    )
+    generate_stats(merged, category_flags, output_dir / 'stats.json')
 
-    calendar_data = generate_per_calendar_data(
+    calendar_sizes = generate_per_calendar_data(
         inventory,
         individual,
         symbol_instances,
         gazetteer,
         symbol_categories,
         output_dir,
+        jobs=args.jobs,
     )
 
-    # Save calendar data index
-    calendar_index = {
-        cal_id: {
-            'size_kb': len(json_str.encode('utf-8')) / 1024,
-            'external': len(json_str.encode('utf-8')) / 1024 > 30,
-        }
-        for cal_id, json_str in calendar_data.items()
-    }
+    # Save calendar data index; every calendar is served from the manifest
+    calendar_index = {cal_id: {'size_kb': size_kb} for cal_id, size_kb in calendar_sizes.items()}
 
-    with open(output_dir / 'calendar_index.json', 'w', encoding='utf-8') as f:
-        json.dump(calendar_index, f, ensure_ascii=False, indent=2)
+    (output_dir / 'calendar_index.json').write_bytes(dump_json(calendar_index, indent=True))
 
     print("\n" + "=" * 60)
     print("✓ Data preparation complete")
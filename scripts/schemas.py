@@ -3,6 +3,9 @@ Data validation schemas for Runestaves data files.
 
 Uses Pandera for robust TSV validation with clear error reporting.
 Critical fields are strictly validated; optional fields allow nulls.
+
+Schemas are module-level objects, built once at import and shared by every
+validation; import them rather than rebuilding them per call.
 """
 
 import pandera as pa
@@ -191,7 +194,7 @@ class ValidationConfig:
     ]
 
 
-def validate_dataframe(df, schema, name: str, strict: bool = False):
+def validate_dataframe(df, schema, name: str, strict: bool = False, lazy: bool = True, log=print):
     """
     Validate a DataFrame against a schema.
 
@@ -200,6 +203,8 @@ def validate_dataframe(df, schema, name: str, strict: bool = False):
         schema: Pandera schema
         name: Name for error messages
         strict: If True, raise on any error; if False, warn and continue
+        lazy: If True, collect every failure case; if False, stop at the first
+        log: Callable receiving each report message (default: print)
 
     Returns:
         Validated DataFrame (potentially coerced)
@@ -208,15 +213,15 @@ def validate_dataframe(df, schema, name: str, strict: bool = False):
         pa.errors.SchemaError: If strict=True and validation fails
     """
     try:
-        validated = schema.validate(df, lazy=True)
-        print(f"✓ {name} validated successfully ({len(df)} rows)")
+        validated = schema.validate(df, lazy=lazy)
+        log(f"✓ {name} validated successfully ({len(df)} rows)")
         return validated
-    except pa.errors.SchemaErrors as err:
-        print(f"⚠ {name} validation warnings:")
-        print(err.failure_cases)
+    except (pa.errors.SchemaError, pa.errors.SchemaErrors) as err:
+        log(f"⚠ {name} validation warnings:")
+        log(str(err.failure_cases))
 
         if strict:
             raise
         else:
-            print(f"  Continuing with {len(df)} rows (some may have issues)")
+            log(f"  Continuing with {len(df)} rows (some may have issues)")
             return df
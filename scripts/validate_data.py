@@ -13,9 +13,15 @@ Runs as part of site-prepare pipeline.
 
 import argparse
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 
 from schemas import (
     ValidationConfig,
@@ -29,15 +35,191 @@ from schemas import (
 )
 
 
-def load_tsv(path: Path, name: str) -> pd.DataFrame:
-    """Load a TSV file with standard settings."""
+# Parsed TSVs are cached here as Parquet, keyed by source mtime and size
+DATA_CACHE_DIR = Path(__file__).parent.parent / '.data-cache'
+
+# Files larger than this are streamed and validated chunk by chunk
+STREAMING_THRESHOLD_BYTES = 256 << 20
+
+# Columns kept from streamed tables for the integrity checks and summary
+KEY_COLUMNS = {
+    'inventory': ['id', 'location_id'],
+    'individual': ['cal_id'],
+    'gazetteer': ['geoid', 'latitude', 'longitude'],
+    'symbol_instances': ['cal_id'],
+}
+
+
+class Reporter:
+    """
+    Collect report lines and write them to stdout in a single call.
+
+    Used as a context manager, the buffer is flushed on exit, including on
+    sys.exit, so piped output (e.g. captured by watch.py) arrives at once.
+    """
+
+    def __init__(self):
+        self._lines: list[str] = []
+
+    def info(self, message: str = '') -> None:
+        self._lines.append(message)
+
+    def flush(self) -> None:
+        if self._lines:
+            sys.stdout.write('\n'.join(self._lines) + '\n')
+            sys.stdout.flush()
+            self._lines.clear()
+
+    def __enter__(self) -> 'Reporter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+
+def _tsv_options(path: Path) -> dict:
+    """pyarrow CSV options reading every column as a string with blanks as ''."""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        header = f.readline().rstrip('\r\n').split('\t')
+
+    return {
+        'read_options': pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        'parse_options': pacsv.ParseOptions(delimiter='\t'),
+        'convert_options': pacsv.ConvertOptions(
+            column_types={col: pa.string() for col in header},
+            null_values=[],
+            strings_can_be_null=False,
+        ),
+    }
+
+
+def read_tsv_cached(path: Path, log=print) -> pa.Table:
+    """
+    Parse a TSV file, reusing a Parquet copy from an earlier run if unchanged.
+
+    A cache entry is valid while the source keeps its mtime and size; other
+    entries for the same file are removed when a new one is written.
+    """
+    stat = path.stat()
+    cache = DATA_CACHE_DIR / f'{path.stem}-{stat.st_mtime_ns}-{stat.st_size}.parquet'
+    if cache.exists():
+        return pq.read_table(cache)
+
+    table = pacsv.read_csv(path, **_tsv_options(path))
+
+    # The cache is only an optimization; a read-only checkout still validates
+    try:
+        DATA_CACHE_DIR.mkdir(exist_ok=True)
+        for stale in DATA_CACHE_DIR.glob(f'{path.stem}-*.parquet'):
+            stale.unlink()
+        tmp = cache.with_suffix('.tmp')
+        pq.write_table(table, tmp, compression='zstd', use_dictionary=True)
+        tmp.replace(cache)
+    except OSError as e:
+        log(f"  ⚠ Could not cache {path.name}: {e}")
+
+    return table
+
+
+def iter_tsv_chunks(path: Path) -> Iterator[pd.DataFrame]:
+    """Yield a TSV file as DataFrames of one pyarrow block each."""
+    for batch in pacsv.open_csv(path, **_tsv_options(path)):
+        yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def load_tsv(path: Path, log=print) -> pd.DataFrame | Iterator[pd.DataFrame]:
+    """
+    Load a TSV file with every column as a string and blanks as ''.
+
+    Parsing uses pyarrow's multi-threaded reader; the result is a pandas
+    DataFrame backed by the Arrow buffers, as the schemas need pandas.
+    Parsed tables are cached as Parquet between runs (see read_tsv_cached).
+    Files over STREAMING_THRESHOLD_BYTES are returned as an iterator of
+    chunks instead, to be consumed by validate_table. A missing file loads
+    as an empty DataFrame.
+    """
     if not path.exists():
-        print(f"⚠ {name} not found: {path}")
         return pd.DataFrame()
 
-    df = pd.read_csv(path, sep='\t', dtype=str, keep_default_na=False)
-    print(f"  Loaded {name}: {len(df)} rows, {len(df.columns)} columns")
-    return df
+    if path.stat().st_size > STREAMING_THRESHOLD_BYTES:
+        return iter_tsv_chunks(path)
+
+    return read_tsv_cached(path, log).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def load_tables(files: dict[str, Path], log=print) -> dict:
+    """
+    Load several TSV files concurrently, reporting each in the given order.
+
+    pyarrow releases the GIL while parsing, so threads overlap the loads
+    without pickling tables between processes.
+
+    Returns:
+        dict mapping each name to what load_tsv returned for its file
+    """
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        tables = dict(zip(files, executor.map(load_tsv, files.values(), [log] * len(files))))
+
+    for name, path in files.items():
+        table = tables[name]
+        if not path.exists():
+            log(f"⚠ {name} not found: {path}")
+        elif not isinstance(table, pd.DataFrame):
+            log(f"  Streaming {name}: {path.stat().st_size / (1 << 20):.0f} MB in chunks")
+        else:
+            log(f"  Loaded {name}: {len(table)} rows, {len(table.columns)} columns")
+
+    return tables
+
+
+def validate_table(table, schema, name: str, strict: bool = False, log=print) -> pd.DataFrame:
+    """
+    Validate a table loaded by load_tsv.
+
+    A streamed table is validated one chunk at a time, keeping only its
+    KEY_COLUMNS, so peak memory is one chunk plus the key columns. Checks
+    spanning chunks (such as uniqueness) only see one chunk at a time.
+
+    Returns:
+        The validated DataFrame, or the key columns of a streamed table
+    """
+    if isinstance(table, pd.DataFrame):
+        return validate_dataframe(table, schema, name, strict, log=log)
+
+    keys = []
+    start = 0
+    for chunk in table:
+        end = start + len(chunk)
+        validate_dataframe(chunk, schema, f'{name}[{start}:{end}]', strict, log=log)
+        keys.append(chunk[[col for col in KEY_COLUMNS.get(name, []) if col in chunk.columns]])
+        start = end
+        del chunk
+
+    return pd.concat(keys, ignore_index=True) if keys else pd.DataFrame()
+
+
+def sort_keys(keys: pd.Series) -> np.ndarray:
+    """Referenced key column as a sorted fixed-width string array for find_orphans."""
+    return np.sort(keys.to_numpy(dtype=str))
+
+
+def find_orphans(refs: pd.Series, sorted_keys: np.ndarray) -> list[str]:
+    """
+    Values of refs missing from sorted_keys, unique and in order of appearance.
+
+    Every distinct reference is located by binary search over the sorted
+    buffer (see sort_keys), instead of probing a hash table per row.
+    """
+    # References repeat heavily (many rows per calendar), so search each
+    # distinct value once; unique() keeps order of appearance
+    ref_values = np.asarray(refs.unique(), dtype=str)
+
+    if len(sorted_keys) == 0:
+        return ref_values.tolist()
+
+    idx = np.searchsorted(sorted_keys, ref_values)
+    found = sorted_keys[idx.clip(max=len(sorted_keys) - 1)] == ref_values
+    return ref_values[~found].tolist()
 
 
 def check_referential_integrity(
@@ -45,47 +227,46 @@ def check_referential_integrity(
     individual: pd.DataFrame,
     gazetteer: pd.DataFrame,
     symbol_instances: pd.DataFrame,
+    log=print,
 ) -> bool:
     """Check that foreign key relationships are valid."""
-    print("\nChecking referential integrity...")
+    log("\nChecking referential integrity...")
     all_valid = True
 
+    # Sorted once, shared by both calendar ID checks
+    inventory_ids = sort_keys(inventory['id']) if not inventory.empty else None
+
     # Check individual.cal_id → inventory.id
     if not individual.empty and not inventory.empty:
-        individual_ids = set(individual['cal_id'].unique())
-        inventory_ids = set(inventory['id'].unique())
-        orphan_ids = individual_ids - inventory_ids
+        orphan_ids = find_orphans(individual['cal_id'], inventory_ids)
 
         if orphan_ids:
-            print(f"  ⚠ Found {len(orphan_ids)} calendar IDs in individual.tsv not in inventory.tsv")
-            print(f"    Examples: {list(orphan_ids)[:5]}")
+            log(f"  ⚠ Found {len(orphan_ids)} calendar IDs in individual.tsv not in inventory.tsv")
+            log(f"    Examples: {list(orphan_ids)[:5]}")
             all_valid = False
         else:
-            print(f"  ✓ All individual entries reference valid calendars")
+            log(f"  ✓ All individual entries reference valid calendars")
 
     # Check symbol_instances.cal_id → inventory.id
     if not symbol_instances.empty and not inventory.empty:
-        symbol_ids = set(symbol_instances['cal_id'].unique())
-        orphan_ids = symbol_ids - inventory_ids
+        orphan_ids = find_orphans(symbol_instances['cal_id'], inventory_ids)
 
         if orphan_ids:
-            print(f"  ⚠ Found {len(orphan_ids)} calendar IDs in symbol_instances.tsv not in inventory.tsv")
+            log(f"  ⚠ Found {len(orphan_ids)} calendar IDs in symbol_instances.tsv not in inventory.tsv")
             all_valid = False
         else:
-            print(f"  ✓ All symbol instances reference valid calendars")
+            log(f"  ✓ All symbol instances reference valid calendars")
 
     # Check inventory.location_id → gazetteer.geoid
     if not inventory.empty and not gazetteer.empty:
-        inv_locations = set(inventory['location_id'].dropna().unique())
-        gaz_locations = set(gazetteer['geoid'].unique())
-        missing_locations = inv_locations - gaz_locations
+        missing_locations = find_orphans(inventory['location_id'].dropna(), sort_keys(gazetteer['geoid']))
 
         if missing_locations:
-            print(f"  ⚠ Found {len(missing_locations)} location IDs in inventory not in gazetteer")
-            print(f"    Examples: {list(missing_locations)[:5]}")
+            log(f"  ⚠ Found {len(missing_locations)} location IDs in inventory not in gazetteer")
+            log(f"    Examples: {list(missing_locations)[:5]}")
             all_valid = False
         else:
-            print(f"  ✓ All inventory locations found in gazetteer")
+            log(f"  ✓ All inventory locations found in gazetteer")
 
     return all_valid
 
@@ -105,80 +286,106 @@ def main():
     )
     args = parser.parse_args()
 
-    data_dir = args.data_dir
-    if not data_dir.exists():
-        print(f"ERROR: Data directory not found: {data_dir}")
-        sys.exit(1)
-
-    print(f"Validating data from: {data_dir}")
-    print("=" * 60)
+    with Reporter() as report:
+        data_dir = args.data_dir
+        if not data_dir.exists():
+            report.info(f"ERROR: Data directory not found: {data_dir}")
+            sys.exit(1)
+
+        report.info(f"Validating data from: {data_dir}")
+        report.info("=" * 60)
+
+        # Load all TSV files
+        report.info("\nLoading TSV files...")
+        tables = load_tables({
+            'inventory': data_dir / 'inventory.tsv',
+            'individual': data_dir / 'individual.tsv',
+            'gazetteer': data_dir / 'gazetteer.tsv',
+            'symbol_instances': data_dir / 'generated' / 'symbol_instances.tsv',
+            # Lookup tables
+            'symbol_types': data_dir / 'lookups' / 'symbol_types.tsv',
+            'feast_canonical': data_dir / 'lookups' / 'feast_canonical.tsv',
+        }, log=report.info)
+
+        # Validate schemas
+        report.info("\nValidating schemas...")
+        all_valid = True
+
+        # (name, schema, optional); a missing optional lookup table is skipped
+        to_validate = [
+            ('inventory', inventory_schema, False),
+            ('individual', individual_schema, False),
+            ('gazetteer', gazetteer_schema, False),
+            ('symbol_instances', symbol_instances_schema, False),
+            ('symbol_types', symbol_types_schema, True),
+            ('feast_canonical', feast_canonical_schema, True),
+        ]
+        to_validate = [
+            (name, schema) for name, schema, optional in to_validate
+            if not (optional and isinstance(tables[name], pd.DataFrame) and tables[name].empty)
+        ]
 
-    # Load all TSV files
-    print("\nLoading TSV files...")
-    inventory = load_tsv(data_dir / 'inventory.tsv', 'inventory')
-    individual = load_tsv(data_dir / 'individual.tsv', 'individual')
-    gazetteer = load_tsv(data_dir / 'gazetteer.tsv', 'gazetteer')
-    symbol_instances = load_tsv(data_dir / 'generated' / 'symbol_instances.tsv', 'symbol_instances')
+        def run_validation(name: str, schema) -> tuple:
+            messages = []
+            try:
+                return validate_table(tables[name], schema, name, args.strict, log=messages.append), messages, None
+            except Exception as e:
+                return None, messages, e
+
+        # Validations run concurrently; their reports are printed in table order
+        try:
+            with ThreadPoolExecutor(max_workers=len(to_validate)) as executor:
+                futures = [
+                    (name, executor.submit(run_validation, name, schema))
+                    for name, schema in to_validate
+                ]
+                for name, future in futures:
+                    validated, messages, error = future.result()
+                    for message in messages:
+                        report.info(message)
+                    if error is not None:
+                        raise error
+                    tables[name] = validated
+
+        except Exception as e:
+            report.info(f"\n❌ Schema validation failed: {e}")
+            sys.exit(1)
+
+        inventory = tables['inventory']
+        individual = tables['individual']
+        gazetteer = tables['gazetteer']
+        symbol_instances = tables['symbol_instances']
+
+        # Check referential integrity
+        integrity_valid = check_referential_integrity(
+            inventory, individual, gazetteer, symbol_instances, log=report.info
+        )
 
-    # Load lookup tables
-    symbol_types = load_tsv(data_dir / 'lookups' / 'symbol_types.tsv', 'symbol_types')
-    feast_canonical = load_tsv(data_dir / 'lookups' / 'feast_canonical.tsv', 'feast_canonical')
+        if not integrity_valid and args.strict:
+            report.info("\n❌ Referential integrity check failed")
+            sys.exit(1)
 
-    # Validate schemas
-    print("\nValidating schemas...")
-    all_valid = True
+        # Summary
+        report.info("\n" + "=" * 60)
+        report.info("Validation Summary:")
+        report.info(f"  Calendars: {len(inventory)}")
+        report.info(f"  Daily entries: {len(individual)}")
+        report.info(f"  Locations: {len(gazetteer)}")
+        report.info(f"  Symbol instances: {len(symbol_instances)}")
 
-    try:
-        inventory = validate_dataframe(inventory, inventory_schema, 'inventory', args.strict)
-        individual = validate_dataframe(individual, individual_schema, 'individual', args.strict)
-        gazetteer = validate_dataframe(gazetteer, gazetteer_schema, 'gazetteer', args.strict)
-        symbol_instances = validate_dataframe(
-            symbol_instances, symbol_instances_schema, 'symbol_instances', args.strict
-        )
+        if gazetteer.empty or 'latitude' not in gazetteer.columns:
+            report.info(f"  ⚠ Gazetteer missing or incomplete")
+        else:
+            # Only the count is needed; one mask pass, no filtered frame
+            has_coords = gazetteer[['latitude', 'longitude']].notna().all(axis=1)
+            report.info(f"  Locations with coordinates: {has_coords.sum()}/{len(gazetteer)}")
 
-        if not symbol_types.empty:
-            symbol_types = validate_dataframe(
-                symbol_types, symbol_types_schema, 'symbol_types', args.strict
-            )
-
-        if not feast_canonical.empty:
-            feast_canonical = validate_dataframe(
-                feast_canonical, feast_canonical_schema, 'feast_canonical', args.strict
-            )
-
-    except Exception as e:
-        print(f"\n❌ Schema validation failed: {e}")
-        sys.exit(1)
-
-    # Check referential integrity
-    integrity_valid = check_referential_integrity(inventory, individual, gazetteer, symbol_instances)
-
-    if not integrity_valid and args.strict:
-        print("\n❌ Referential integrity check failed")
-        sys.exit(1)
-
-    # Summary
-    print("\n" + "=" * 60)
-    print("Validation Summary:")
-    print(f"  Calendars: {len(inventory)}")
-    print(f"  Daily entries: {len(individual)}")
-    print(f"  Locations: {len(gazetteer)}")
-    print(f"  Symbol instances: {len(symbol_instances)}")
-
-    if gazetteer.empty or 'latitude' not in gazetteer.columns:
-        print(f"  ⚠ Gazetteer missing or incomplete")
-    else:
-        valid_coords = gazetteer[
-            gazetteer['latitude'].notna() & gazetteer['longitude'].notna()
-        ]
-        print(f"  Locations with coordinates: {len(valid_coords)}/{len(gazetteer)}")
-
-    if all_valid and integrity_valid:
-        print("\n✓ All validations passed")
-        sys.exit(0)
-    else:
-        print("\n⚠ Some validations failed (continuing anyway)")
-        sys.exit(0 if not args.strict else 1)
+        if all_valid and integrity_valid:
+            report.info("\n✓ All validations passed")
+            sys.exit(0)
+        else:
+            report.info("\n⚠ Some validations failed (continuing anyway)")
+            sys.exit(0 if not args.strict else 1)
 
 
 if __name__ == '__main__':
@@ -8,61 +8,133 @@ Monitors:
 - static/
 - i18n/
 
-On change, runs: make site-build
+On change, rebuilds the site in-process with build_site.build_site(), so
+interpreter startup and imports are paid once. build_site.py itself is
+reloaded when it changes; changes to the other scripts affect data
+preparation, so those still run the full pipeline: make site-build
 """
 
+import argparse
+import importlib
+import os
+import re
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
+import build_site
+
 try:
+    # The default Observer already selects inotify on Linux
     from watchdog.observers import Observer
     from watchdog.events import FileSystemEventHandler
 except ImportError:
     print("ERROR: watchdog not installed. Run: pip install watchdog")
     sys.exit(1)
 
+# Directory names never scheduled, so their events are never delivered
+EXCLUDED_DIRS = {'.git', '__pycache__', 'site', 'venv', '.venv'}
+
+
+# Generated and temporary paths whose events never trigger a rebuild
+_EXCLUDE_RE = re.compile(r'\.git|__pycache__|\.pyc|site/|venv/')
+
+
+def iter_watch_dirs(root: Path):
+    """Yield root and its subdirectories, pruning EXCLUDED_DIRS."""
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in EXCLUDED_DIRS]
+        yield dirpath
+
 
 class RebuildHandler(FileSystemEventHandler):
-    """Handle file system events by triggering rebuild."""
+    """
+    Handle file system events by triggering rebuild.
 
-    def __init__(self):
-        self.last_rebuild = 0
+    Events are coalesced: each one restarts a timer, and the rebuild runs
+    once the files have been quiet for debounce_seconds, covering every
+    path changed in the burst.
+    """
+
+    def __init__(self, build_argv: list[str]):
         self.debounce_seconds = 1
+        self.build_argv = build_argv
+        self.builder = build_site
+        self._timer: threading.Timer | None = None
+        self._pending: set[Path] = set()
+        self._lock = threading.Lock()  # guards _timer and _pending
+        self._build_lock = threading.Lock()  # one rebuild at a time
 
     def on_modified(self, event):
-        if event.is_directory:
-            return
-
-        # Debounce rapid changes
-        now = time.time()
-        if now - self.last_rebuild < self.debounce_seconds:
-            return
-
         # Ignore generated files and temporary files
-        if any(
-            part in event.src_path
-            for part in ['.git', '__pycache__', '.pyc', 'site/', 'venv/']
-        ):
+        if _EXCLUDE_RE.search(event.src_path) or event.is_directory:
             return
 
-        print(f"\n{'=' * 60}")
-        print(f"File changed: {event.src_path}")
-        print("Rebuilding site...")
-        print('=' * 60)
+        # Restart the quiet period on every event
+        with self._lock:
+            self._pending.add(Path(event.src_path))
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_seconds, self._do_rebuild)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _do_rebuild(self):
+        with self._build_lock:
+            with self._lock:
+                changed, self._pending = self._pending, set()
+            if not changed:
+                return
+
+            print(f"\n{'=' * 60}")
+            for path in sorted(changed):
+                print(f"File changed: {path}")
+            print("Rebuilding site...")
+            print('=' * 60)
+
+            if self.rebuild(changed):
+                print("\n✓ Rebuild complete")
+
+    def rebuild(self, changed: set[Path]) -> bool:
+        """Rebuild after changes to the given paths; returns success."""
+        if any(path.suffix == '.py' and path.name != 'build_site.py' for path in changed):
+            # Data preparation may have changed; run the whole pipeline
+            try:
+                result = subprocess.run(['make', 'site-build'], check=True, capture_output=True, text=True)
+                print(result.stdout)
+                return True
+            except subprocess.CalledProcessError as e:
+                print(f"\n❌ Rebuild failed:")
+                print(e.stderr)
+                return False
 
         try:
-            result = subprocess.run(['make', 'site-build'], check=True, capture_output=True, text=True)
-            print(result.stdout)
-            print("\n✓ Rebuild complete")
-            self.last_rebuild = now
-        except subprocess.CalledProcessError as e:
+            if any(path.name == 'build_site.py' for path in changed):
+                self.builder = importlib.reload(self.builder)
+            self.builder.clear_caches()
+            self.builder.build_site(self.builder.parse_args(self.build_argv))
+            return True
+        except (Exception, SystemExit) as e:
             print(f"\n❌ Rebuild failed:")
-            print(e.stderr)
+            print(f"  {type(e).__name__}: {e}")
+            return False
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Watch sources and rebuild the site')
+    parser.add_argument('--data-dir', type=Path, default=Path('../runestaves_data/zenodo/data'))
+    parser.add_argument('--site-dir', type=Path, default=Path('site'))
+    parser.add_argument('--base-path', type=str, default='')
+    args = parser.parse_args()
+
+    # Rebuilds run on a timer thread, so render serially rather than forking
+    # a process pool from a multi-threaded process
+    build_argv = ['--data-dir', str(args.data_dir), '--site-dir', str(args.site_dir), '--jobs', '1']
+    if args.base_path:
+        build_argv += ['--base-path', args.base_path]
+
     project_root = Path(__file__).parent.parent
 
     # Directories to watch
@@ -77,12 +149,15 @@ def main():
     print(f"Monitoring: {', '.join(str(d.name) for d in watch_dirs)}")
     print("Press Ctrl+C to stop\n")
 
-    event_handler = RebuildHandler()
+    event_handler = RebuildHandler(build_argv)
     observer = Observer()
 
+    # Schedule each directory non-recursively so excluded subtrees are
+    # never watched; directories created later are not picked up
     for watch_dir in watch_dirs:
         if watch_dir.exists():
-            observer.schedule(event_handler, str(watch_dir), recursive=True)
+            for path in iter_watch_dirs(watch_dir):
+                observer.schedule(event_handler, path, recursive=False)
             print(f"  ✓ Watching {watch_dir.relative_to(project_root)}")
 
     observer.start()
@@ -2,7 +2,7 @@
  * Calendar Detail Page - Feast table, symbol charts, mini map
  *
  * Responsibilities:
- * - Load calendar data (embedded or external JSON)
+ * - Load calendar data (embedded or from the calendars.json manifest)
  * - Render feast table with filtering/searching
  * - Render symbol charts with D3.js
  * - Initialize mini map showing calendar location
@@ -37,11 +37,11 @@
         //     calendarData = JSON.parse(dataElement.textContent);
         //     initializeComponents();
         // } else {
-        //     // Fetch external JSON
+        //     // Fetch the shared manifest and pick this calendar
         //     fetch(calendarDataUrl)
         //         .then(response => response.json())
-        //         .then(data => {
-        //             calendarData = data;
+        //         .then(calendars => {
+        //             calendarData = calendars[config.calId];
         //             initializeComponents();
         //         });
         // }
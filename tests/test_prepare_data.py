@@ -0,0 +1,103 @@
+"""Tests for the vectorized helpers in scripts/prepare_data.py."""
+
+import math
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from prepare_data import (  # noqa: E402
+    assign_period_buckets,
+    compute_symbol_categories,
+    parse_year_range_vec,
+    read_tsv,
+)
+from schemas import ValidationConfig  # noqa: E402
+
+NAN = float('nan')
+
+# Outputs of the original row-by-row parse_year_range
+YEAR_CASES = [
+    ('1650', (1650, 1650)),
+    ('1650-1700', (1650, 1700)),
+    (' 1600 - 1650', (1600, 1650)),
+    ('1650-1700-1750', (1650, 1700)),
+    ('ante 1700', (1600, 1700)),
+    ('Post 1650', (1650, 1750)),
+    ('ante 1700-1750', (NAN, NAN)),
+    ('1e3', (1000, 1000)),
+    ('-1650', (NAN, NAN)),
+    ('x', (NAN, NAN)),
+    ('', (NAN, NAN)),
+    (None, (NAN, NAN)),
+]
+
+
+def _same(a: float, b: float) -> bool:
+    return (math.isnan(a) and math.isnan(b)) or a == b
+
+
+@pytest.mark.parametrize('value,expected', YEAR_CASES)
+def test_parse_year_range_vec(value, expected):
+    result = parse_year_range_vec(pd.Series([value, '1650'], dtype=object))
+    assert _same(result.at[0, 'year_min'], expected[0])
+    assert _same(result.at[0, 'year_max'], expected[1])
+    assert result.at[1, 'year_min'] == result.at[1, 'year_max'] == 1650
+
+
+def test_parse_year_range_vec_keeps_index():
+    years = pd.Series(['1650', '1650', 'post 1650'], index=[10, 20, 30])
+    result = parse_year_range_vec(years)
+    assert list(result.index) == [10, 20, 30]
+    assert list(result['year_max']) == [1650, 1650, 1750]
+
+
+# Outputs of the original per-row assign_period_bucket
+PERIOD_CASES = [
+    (1527, 1527, 'Medieval'),
+    (1528, 1528, '16th century'),
+    (1600, 1601, 'Unknown'),
+    (1650, 1750, '17th century'),
+    (1900, 1900, '19th century'),
+    (1901, 1901, 'Unknown'),
+    (NAN, 1650, 'Unknown'),
+]
+
+
+@pytest.mark.parametrize('year_min,year_max,period_en', PERIOD_CASES)
+def test_assign_period_buckets(year_min, year_max, period_en):
+    result = assign_period_buckets(pd.Series([year_min]), pd.Series([year_max]))
+    assert result.at[0, 'period_en'] == period_en
+
+
+@pytest.mark.parametrize('dtype', [object, 'category'])
+def test_compute_symbol_categories_keeps_unmapped_calendars(dtype):
+    symbol_types = pd.DataFrame({'symbol_type': ['cross', 'crown'], 'category': ['religious', 'royal']})
+    symbol_instances = pd.DataFrame(
+        {
+            'cal_id': pd.Series(['C1', 'C1', 'C2', 'C2'], dtype=dtype),
+            'symbol_type': ['cross', 'mystery', 'mystery', None],
+        }
+    )
+    flags = compute_symbol_categories(symbol_instances, symbol_types).to_dict('index')
+
+    assert set(flags) == {'C1', 'C2'}
+    assert flags['C1']['has_religious'] and not flags['C1']['has_royal']
+    assert flags['C2'] == {f'has_{cat}': False for cat in ValidationConfig.SYMBOL_CATEGORIES}
+
+
+def test_read_tsv_empty_column(tmp_path):
+    path = tmp_path / 'gazetteer.tsv'
+    path.write_text('geoid\tname\tlatitude\tlongitude\taccuracy\n001\tA\t57.5\t\t\n', encoding='utf-8')
+    gazetteer = read_tsv(path, column_types={'latitude': pa.float64(), 'longitude': pa.float64()})
+
+    assert gazetteer.at[0, 'geoid'] == '001'
+    assert gazetteer.at[0, 'latitude'] == 57.5
+    assert pd.isna(gazetteer.at[0, 'longitude'])
+    # An all-empty column stays a string column rather than being typed null
+    assert gazetteer.at[0, 'accuracy'] == ''
+    assert gazetteer['accuracy'].fillna('unknown').tolist() == ['']